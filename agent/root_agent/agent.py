@@ -82,6 +82,13 @@ When you receive a user query, follow this process:
 > 1.  It runs `downloader.py` to fetch data, which likely creates `raw_data.zip`.
 > 2.  It unzips `raw_data.zip` into the `temp/` directory.
 > 3.  It runs `processor.py` to analyze the unzipped files.
+
+#### **V. REPOSITORY DIGEST**
+
+* The digest below was pre-computed when the repository was ingested. It lists the directory tree with sizes, the language breakdown, entry points, dependency manifests, and top-level symbols per module.
+* Use it to orient yourself before asking clarifying questions or inspecting files. If it is empty, fall back to the reconnaissance steps above.
+
+{repository_summary?}
     
     """,
 )
@@ -1,7 +1,7 @@
 """Agent service-related routes"""
 from flask import Blueprint, request, jsonify
 
-from utils.agent import check_session_exists, create_agent_session, send_chat_message
+from utils.agent import check_session_exists, create_agent_session, default_session_id, send_chat_message
 
 agent_bp = Blueprint('agent', __name__)
 
@@ -53,9 +53,13 @@ def create_session():
     
     repository = data.get('repository', '')
     user_id = data.get('user_id', 'default_user')
-    session_id = data.get('session_id', f'session_{repository.replace("/", "_")}')
+    commit_sha = data.get('commit_sha')
+    session_id = data.get('session_id', default_session_id(repository, commit_sha))
+    repository_summary = data.get('repository_summary')
     
-    success, response_data, status_code = create_agent_session(user_id, session_id, repository)
+    success, response_data, status_code = create_agent_session(
+        user_id, session_id, repository, commit_sha, repository_summary
+    )
     
     return jsonify(response_data), status_code
 
@@ -75,13 +79,14 @@ def chat():
     files = data.get('files', [])
     user_id = data.get('user_id', 'default_user')
     session_id = data.get('session_id')
+    commit_sha = data.get('commit_sha')
     
-    # If no session_id provided, create one based on repository
+    # If no session_id provided, create one based on repository and commit
     if not session_id:
-        session_id = f'session_{repository.replace("/", "_")}' if repository else 'default_session'
+        session_id = default_session_id(repository, commit_sha) if repository else 'default_session'
         
         # Try to create the session first
-        create_agent_session(user_id, session_id, repository)
+        create_agent_session(user_id, session_id, repository, commit_sha, data.get('repository_summary'))
     
     success, response_data, status_code = send_chat_message(
         user_id, session_id, message, repository, files
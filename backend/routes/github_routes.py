@@ -113,6 +113,8 @@ def gather_files():
     
     return jsonify({
         'repository': result.get('repository'),
+        'commit_sha': result.get('commit_sha'),
+        'repository_summary': result.get('repository_summary'),
         'files': files_array,
         'total_files': result.get('total_files', len(files_array))
     }), 200
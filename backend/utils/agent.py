@@ -1,6 +1,27 @@
 """Agent service communication utilities"""
 import requests
 from config import AGENT_SERVICE_URL
+from utils.repo_summary import MAX_SUMMARY_CHARS, get_repository_summary, normalize_repository
+
+
+def default_session_id(repository, commit_sha=None):
+    """
+    Build the session ID used when the client does not provide one
+    
+    Each ingested commit gets its own session so it is seeded with that
+    commit's repository summary. Mirrors generateSessionId in the frontend.
+    
+    Args:
+        repository: Repository name/identifier
+        commit_sha: Optional commit SHA
+    
+    Returns:
+        str: Session identifier
+    """
+    session_id = f'session_{normalize_repository(repository).replace("/", "_")}'
+    if commit_sha:
+        session_id += f'_{commit_sha[:12]}'
+    return session_id
 
 
 def check_session_exists(user_id, session_id):
@@ -30,22 +51,37 @@ def check_session_exists(user_id, session_id):
         return False, 500, f'Error checking session: {str(e)}'
 
 
-def create_agent_session(user_id, session_id, repository=''):
+def create_agent_session(user_id, session_id, repository='', commit_sha=None, repository_summary=None):
     """
     Create a new agent session
     
+    The session state is seeded with the repository summary built during
+    ingestion, so the agent starts with the project layout. The summary cached
+    by this process is preferred; otherwise the one returned to the client by
+    /gather-files is used, since ingestion may have run on another instance.
+    
     Args:
         user_id: User identifier
         session_id: Session identifier
         repository: Repository name/identifier
+        commit_sha: Optional commit SHA; defaults to the latest ingested commit
+        repository_summary: Optional summary sent back by the client
     
     Returns:
         tuple: (success: bool, data: dict, status_code: int)
     """
     try:
         session_url = f"{AGENT_SERVICE_URL}/apps/root_agent/users/{user_id}/sessions/{session_id}"
+        cached_summary = get_repository_summary(repository, commit_sha)
+        if cached_summary:
+            repository_summary = cached_summary
+        elif isinstance(repository_summary, str):
+            repository_summary = repository_summary[:MAX_SUMMARY_CHARS]
+        else:
+            repository_summary = None
         session_payload = {
             "state": {
+                "repository_summary": repository_summary or '',
                 "repository": repository,
                 "initialized": True
             }
@@ -63,6 +99,7 @@ def create_agent_session(user_id, session_id, repository=''):
                 'session_id': session_data.get('id', session_id),
                 'user_id': user_id,
                 'repository': repository,
+                'has_summary': bool(repository_summary),
                 'message': 'Session created successfully'
             }, 200
         else:
@@ -0,0 +1,402 @@
+"""Repository summary utilities for warming agent sessions"""
+import ast
+import json
+import os
+import re
+import tomllib
+from collections import OrderedDict, defaultdict
+
+# Digests are cached by (repository, commit SHA) so each commit is summarized only once.
+# The cache is per process and least-recently-used entries are evicted past MAX_CACHED_SUMMARIES.
+_summary_cache = OrderedDict()
+
+# Most recently ingested commit SHA for each repository ("owner/repo")
+_latest_commits = OrderedDict()
+
+MAX_CACHED_SUMMARIES = 128
+
+# Hard cap on the digest size so it stays cheap to carry in session state
+MAX_SUMMARY_CHARS = 6000
+
+TREE_DEPTH = 2
+MAX_TREE_ENTRIES = 40
+MAX_SYMBOL_MODULES = 30
+MAX_SYMBOLS_PER_MODULE = 12
+MAX_DEPENDENCIES = 25
+
+LANGUAGES = {
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.jsx': 'JavaScript',
+    '.mjs': 'JavaScript',
+    '.cjs': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.tsx': 'TypeScript',
+    '.go': 'Go',
+    '.rs': 'Rust',
+    '.java': 'Java',
+    '.kt': 'Kotlin',
+    '.rb': 'Ruby',
+    '.php': 'PHP',
+    '.c': 'C',
+    '.h': 'C',
+    '.cpp': 'C++',
+    '.cc': 'C++',
+    '.hpp': 'C++',
+    '.cs': 'C#',
+    '.swift': 'Swift',
+    '.scala': 'Scala',
+    '.sh': 'Shell',
+    '.html': 'HTML',
+    '.css': 'CSS',
+    '.scss': 'CSS',
+    '.sql': 'SQL',
+    '.md': 'Markdown',
+    '.json': 'JSON',
+    '.yaml': 'YAML',
+    '.yml': 'YAML',
+    '.toml': 'TOML',
+}
+
+# Lockfiles and generated assets would otherwise dominate the language breakdown
+GENERATED_FILES = {
+    'package-lock.json',
+    'npm-shrinkwrap.json',
+    'pnpm-lock.yaml',
+    'yarn.lock',
+    'go.sum',
+}
+
+GENERATED_SUFFIXES = (
+    '.lock',
+    '-lock.json',
+    '-lock.yaml',
+    '.min.js',
+    '.min.css',
+    '.map',
+)
+
+MANIFESTS = {
+    'requirements.txt',
+    'pyproject.toml',
+    'setup.py',
+    'setup.cfg',
+    'Pipfile',
+    'package.json',
+    'go.mod',
+    'Cargo.toml',
+    'pom.xml',
+    'build.gradle',
+    'build.gradle.kts',
+    'Gemfile',
+    'composer.json',
+}
+
+ENTRY_POINT_NAMES = {
+    'main.py',
+    '__main__.py',
+    'app.py',
+    'manage.py',
+    'wsgi.py',
+    'asgi.py',
+    'main.go',
+    'main.rs',
+    'index.js',
+    'index.ts',
+    'server.js',
+    'server.ts',
+    'Dockerfile',
+    'Makefile',
+    'Procfile',
+}
+
+# Top-level declarations for languages without a parser in the standard library
+SYMBOL_PATTERNS = {
+    'JavaScript': re.compile(
+        r'^export\s+(?:default\s+)?(?:async\s+)?(?:function\*?|class|const|let|var)\s+([A-Za-z_$][\w$]*)',
+        re.MULTILINE
+    ),
+    'TypeScript': re.compile(
+        r'^export\s+(?:default\s+)?(?:async\s+)?(?:function\*?|class|const|let|var|interface|type|enum)\s+([A-Za-z_$][\w$]*)',
+        re.MULTILINE
+    ),
+    'Go': re.compile(r'^(?:func|type)\s+(?:\([^)]*\)\s*)?([A-Za-z_]\w*)', re.MULTILINE),
+    'Rust': re.compile(r'^pub\s+(?:fn|struct|enum|trait|mod)\s+([A-Za-z_]\w*)', re.MULTILINE),
+    'Java': re.compile(r'^public\s+(?:final\s+|abstract\s+)*(?:class|interface|enum|record)\s+([A-Za-z_]\w*)', re.MULTILINE),
+}
+
+
+def normalize_repository(repository):
+    """
+    Normalize a repository name or URL to the canonical owner/repo form
+
+    Args:
+        repository: Repository name/identifier, optionally a GitHub URL
+
+    Returns:
+        str: Repository name without host, trailing slash or .git suffix
+    """
+    name = re.sub(r'^https?://(www\.)?github\.com/', '', (repository or '').strip())
+    return name.strip('/').removesuffix('.git')
+
+
+def _format_size(size):
+    """Format a byte count as a short human-readable string"""
+    for unit in ['B', 'KB', 'MB']:
+        if size < 1024:
+            return f'{size:.0f}{unit}' if unit == 'B' else f'{size:.1f}{unit}'
+        size /= 1024
+    return f'{size:.1f}GB'
+
+
+def _summarize_tree(sizes):
+    """Aggregate file counts and sizes per directory up to TREE_DEPTH"""
+    dirs = defaultdict(lambda: [0, 0])
+    for path, size in sizes.items():
+        parts = path.split('/')[:-1]
+        for depth in range(min(len(parts), TREE_DEPTH) + 1):
+            key = '/'.join(parts[:depth]) or '.'
+            dirs[key][0] += 1
+            dirs[key][1] += size
+
+    lines = []
+    # Sort by path components so each directory is followed directly by its subdirectories
+    ordered = sorted(dirs, key=lambda key: [] if key == '.' else key.split('/'))
+    for key in ordered[:MAX_TREE_ENTRIES]:
+        count, size = dirs[key]
+        indent = '  ' * (0 if key == '.' else key.count('/') + 1)
+        name = key if key == '.' else key.rsplit('/', 1)[-1] + '/'
+        lines.append(f'{indent}{name} ({count} files, {_format_size(size)})')
+    if len(dirs) > MAX_TREE_ENTRIES:
+        lines.append(f'  ... {len(dirs) - MAX_TREE_ENTRIES} more directories')
+    return lines
+
+
+def _is_generated(path):
+    """Check whether a file is a lockfile or generated asset"""
+    name = os.path.basename(path)
+    return name in GENERATED_FILES or name.endswith(GENERATED_SUFFIXES)
+
+
+def _summarize_languages(sizes):
+    """Break down repository bytes by language, ignoring generated files"""
+    totals = defaultdict(int)
+    for path, size in sizes.items():
+        if _is_generated(path):
+            continue
+        language = LANGUAGES.get(os.path.splitext(path)[1].lower())
+        if language:
+            totals[language] += size
+
+    grand_total = sum(totals.values()) or 1
+    ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+    return [
+        f'{language}: {size * 100 / grand_total:.1f}% ({_format_size(size)})'
+        for language, size in ranked
+    ]
+
+
+def _parse_dependencies(name, content):
+    """Extract dependency names from a manifest file, best effort"""
+    try:
+        if name == 'requirements.txt':
+            deps = [
+                re.split(r'[\s<>=!~;\[]', line.strip(), maxsplit=1)[0]
+                for line in content.splitlines()
+                if line.strip() and not line.strip().startswith(('#', '-'))
+            ]
+        elif name == 'package.json':
+            data = json.loads(content)
+            deps = list(data.get('dependencies', {})) + list(data.get('devDependencies', {}))
+        elif name == 'pyproject.toml':
+            data = tomllib.loads(content)
+            deps = [
+                re.split(r'[\s<>=!~;\[]', dep.strip(), maxsplit=1)[0]
+                for dep in data.get('project', {}).get('dependencies', [])
+            ]
+            deps += list(data.get('tool', {}).get('poetry', {}).get('dependencies', {}))
+        elif name == 'Cargo.toml':
+            deps = list(tomllib.loads(content).get('dependencies', {}))
+        elif name == 'go.mod':
+            deps = re.findall(r'^\s*(?:require\s+)?([\w.\-]+\.[\w.\-/]+)\s+v', content, re.MULTILINE)
+        else:
+            return []
+    except (ValueError, AttributeError, TypeError):
+        return []
+    return [dep for dep in deps if dep]
+
+
+def _find_entry_points(files):
+    """Find likely entry points from well-known filenames and manifests"""
+    entry_points = [
+        path for path in files
+        if os.path.basename(path) in ENTRY_POINT_NAMES
+    ]
+
+    for path, content in files.items():
+        name = os.path.basename(path)
+        try:
+            if name == 'package.json':
+                data = json.loads(content)
+                if data.get('main'):
+                    entry_points.append(f"{path} main: {data['main']}")
+                for script in ['start', 'dev', 'build']:
+                    if script in data.get('scripts', {}):
+                        entry_points.append(f"{path} scripts.{script}: {data['scripts'][script]}")
+            elif name == 'pyproject.toml':
+                scripts = tomllib.loads(content).get('project', {}).get('scripts', {})
+                for script, target in scripts.items():
+                    entry_points.append(f'{path} script {script}: {target}')
+        except (ValueError, AttributeError, TypeError):
+            continue
+
+    return sorted(set(entry_points))
+
+
+def _top_level_symbols(path, content):
+    """List public top-level classes and functions declared in a source file"""
+    language = LANGUAGES.get(os.path.splitext(path)[1].lower())
+
+    if language == 'Python':
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError, MemoryError, RecursionError):
+            return []
+        return [
+            node.name for node in tree.body
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+            and not node.name.startswith('_')
+        ]
+
+    pattern = SYMBOL_PATTERNS.get(language)
+    if not pattern:
+        return []
+    return list(dict.fromkeys(pattern.findall(content)))
+
+
+def build_repository_summary(repository, commit_sha, files, sizes=None):
+    """
+    Build a compact structural digest of a repository
+
+    Args:
+        repository: Repository name/identifier (owner/repo)
+        commit_sha: Commit SHA the files were fetched at
+        files: Dictionary mapping file paths to their content
+        sizes: Optional dictionary mapping file paths to blob sizes in bytes
+
+    Returns:
+        str: Plain-text digest no longer than MAX_SUMMARY_CHARS
+    """
+    if sizes is None:
+        sizes = {}
+    sizes = {
+        path: sizes.get(path, len(content.encode('utf-8')) if isinstance(content, str) else 0)
+        for path, content in files.items()
+    }
+
+    sections = [f'Repository: {repository} @ {commit_sha or "unknown"}']
+
+    sections.append('Directory tree:\n' + '\n'.join(_summarize_tree(sizes)))
+
+    languages = _summarize_languages(sizes)
+    if languages:
+        sections.append('Languages:\n' + '\n'.join(f'  {line}' for line in languages))
+
+    entry_points = _find_entry_points(files)
+    if entry_points:
+        sections.append('Entry points:\n' + '\n'.join(f'  {line}' for line in entry_points))
+
+    manifests = []
+    for path in sorted(files):
+        name = os.path.basename(path)
+        if name not in MANIFESTS:
+            continue
+        deps = _parse_dependencies(name, files[path])
+        line = f'  {path}'
+        if deps:
+            line += ': ' + ', '.join(deps[:MAX_DEPENDENCIES])
+            if len(deps) > MAX_DEPENDENCIES:
+                line += f', ... (+{len(deps) - MAX_DEPENDENCIES})'
+        manifests.append(line)
+    if manifests:
+        sections.append('Dependency manifests:\n' + '\n'.join(manifests))
+
+    modules = []
+    for path in sorted(files):
+        symbols = _top_level_symbols(path, files[path])
+        if not symbols:
+            continue
+        line = f'  {path}: ' + ', '.join(symbols[:MAX_SYMBOLS_PER_MODULE])
+        if len(symbols) > MAX_SYMBOLS_PER_MODULE:
+            line += ', ...'
+        modules.append(line)
+    if modules:
+        if len(modules) > MAX_SYMBOL_MODULES:
+            modules = modules[:MAX_SYMBOL_MODULES] + [f'  ... {len(modules) - MAX_SYMBOL_MODULES} more modules']
+        sections.append('Top-level symbols:\n' + '\n'.join(modules))
+
+    summary = '\n\n'.join(sections)
+    if len(summary) > MAX_SUMMARY_CHARS:
+        summary = summary[:MAX_SUMMARY_CHARS].rsplit('\n', 1)[0] + '\n... (truncated)'
+    return summary
+
+
+def _remember(cache, key, value):
+    """Store a value in an LRU cache, evicting the oldest entry when full"""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > MAX_CACHED_SUMMARIES:
+        cache.popitem(last=False)
+
+
+def ensure_repository_summary(repository, commit_sha, files, sizes=None):
+    """
+    Build and cache the digest for a commit unless it is already cached
+
+    Args:
+        repository: Repository name/identifier (owner/repo)
+        commit_sha: Commit SHA the files were fetched at
+        files: Dictionary mapping file paths to their content
+        sizes: Optional dictionary mapping file paths to blob sizes in bytes
+
+    Returns:
+        str: The cached or newly built digest
+    """
+    repository = normalize_repository(repository)
+    if not commit_sha:
+        return build_repository_summary(repository, commit_sha, files, sizes)
+
+    _remember(_latest_commits, repository, commit_sha)
+
+    key = (repository, commit_sha)
+    if key in _summary_cache:
+        _summary_cache.move_to_end(key)
+        return _summary_cache[key]
+
+    summary = build_repository_summary(repository, commit_sha, files, sizes)
+    _remember(_summary_cache, key, summary)
+    return summary
+
+
+def get_repository_summary(repository, commit_sha=None):
+    """
+    Look up a cached digest
+
+    Args:
+        repository: Repository name/identifier (owner/repo)
+        commit_sha: Optional commit SHA; defaults to the latest ingested commit
+
+    Returns:
+        str or None: The cached digest, or None if that commit has not been
+        ingested for this repository by this process
+    """
+    repository = normalize_repository(repository)
+    sha = commit_sha or _latest_commits.get(repository)
+    if not sha:
+        return None
+
+    key = (repository, sha)
+    if key not in _summary_cache:
+        return None
+    _summary_cache.move_to_end(key)
+    return _summary_cache[key]
@@ -4,6 +4,7 @@ import base64
 import asyncio
 import aiohttp
 from config import GITHUB_TOKEN
+from utils.repo_summary import ensure_repository_summary
 
 
 async def fetch_file_content(session, owner, repo, file_path, auth_token):
@@ -50,7 +51,7 @@ async def get_source_code_async(github_url, token=None):
         return {'error': 'Invalid GitHub URL'}
     
     owner, repo = match.groups()
-    repo = repo.rstrip('.git')  # Remove .git suffix if present
+    repo = repo.removesuffix('.git')  # Remove .git suffix if present
     
     # Use provided token or fall back to environment variable
     auth_token = token or GITHUB_TOKEN
@@ -68,9 +69,19 @@ async def get_source_code_async(github_url, token=None):
     async with aiohttp.ClientSession() as session:
         # Try main branch first
         for branch in ['main', 'master']:
-            api_url = f'https://api.github.com/repos/{owner}/{repo}/git/trees/{branch}?recursive=1'
+            commit_url = f'https://api.github.com/repos/{owner}/{repo}/commits/{branch}'
             
             try:
+                # Resolve the branch to a commit SHA so the tree and its summary are pinned to it
+                sha_headers = {**headers, 'Accept': 'application/vnd.github.sha'}
+                async with session.get(commit_url, headers=sha_headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                    if response.status != 200:
+                        continue
+                    
+                    commit_sha = (await response.text()).strip()
+                
+                api_url = f'https://api.github.com/repos/{owner}/{repo}/git/trees/{commit_sha}?recursive=1'
+                
                 async with session.get(api_url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as response:
                     if response.status != 200:
                         continue
@@ -92,8 +103,18 @@ async def get_source_code_async(github_url, token=None):
                     results = await asyncio.gather(*tasks)
                     files = dict(results)
                     
+                    # Build the structural digest once per commit for warming agent sessions.
+                    # The digest is optional, so a failure here must not fail ingestion.
+                    sizes = {item['path']: item.get('size', 0) for item in file_items}
+                    try:
+                        repository_summary = ensure_repository_summary(f'{owner}/{repo}', commit_sha, files, sizes)
+                    except Exception:
+                        repository_summary = None
+                    
                     return {
                         'repository': f'{owner}/{repo}',
+                        'commit_sha': commit_sha,
+                        'repository_summary': repository_summary,
                         'files': files,
                         'total_files': len(files)
                     }
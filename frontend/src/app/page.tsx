@@ -11,6 +11,9 @@ export default function Home() {
   const [validationError, setValidationError] = useState('');
   const [validationSuccess, setValidationSuccess] = useState(false);
   const [files, setFiles] = useState<any[]>([]);
+  const [repositoryName, setRepositoryName] = useState<string | undefined>(undefined);
+  const [commitSha, setCommitSha] = useState<string | undefined>(undefined);
+  const [repositorySummary, setRepositorySummary] = useState<string | undefined>(undefined);
   const [error, setError] = useState('');
   const [selectedFile, setSelectedFile] = useState<any | null>(null);
   const [showChat, setShowChat] = useState(false);
@@ -85,6 +88,9 @@ export default function Home() {
       }
 
       setFiles(data.files || []);
+      setRepositoryName(data.repository || undefined);
+      setCommitSha(data.commit_sha || undefined);
+      setRepositorySummary(data.repository_summary || undefined);
     } catch (err) {
       setError('Failed to gather files from GitHub repository');
     } finally {
@@ -225,6 +231,9 @@ export default function Home() {
         {showChat && (
           <ChatInterface
             repositoryUrl={githubUrl}
+            repositoryName={repositoryName}
+            commitSha={commitSha}
+            repositorySummary={repositorySummary}
             files={files}
             onClose={() => setShowChat(false)}
           />
@@ -13,11 +13,17 @@ interface Message {
 
 interface ChatInterfaceProps {
   repositoryUrl: string;
+  repositoryName?: string;
+  commitSha?: string;
+  repositorySummary?: string;
   files: any[];
   onClose?: () => void;
 }
 
-export default function ChatInterface({ repositoryUrl, files, onClose }: ChatInterfaceProps) {
+export default function ChatInterface({ repositoryUrl, repositoryName, commitSha, repositorySummary, files, onClose }: ChatInterfaceProps) {
+  // Prefer the canonical owner/repo name returned by /gather-files so it matches the backend cache
+  const repoName = repositoryName || repositoryUrl.replace(/^https?:\/\/(www\.)?github\.com\//, '');
+
   const [messages, setMessages] = useState<Message[]>([
     {
       id: '1',
@@ -48,8 +54,7 @@ export default function ChatInterface({ repositoryUrl, files, onClose }: ChatInt
       sessionInitialized.current = true;
 
       try {
-        const repoName = repositoryUrl.replace(/^https?:\/\/(www\.)?github\.com\//, '');
-        const session = await ensureSession(repoName);
+        const session = await ensureSession(repoName, 'default_user', commitSha, repositorySummary);
         
         if (session) {
           setSessionId(session.session_id);
@@ -71,7 +76,7 @@ export default function ChatInterface({ repositoryUrl, files, onClose }: ChatInt
     };
 
     initializeSession();
-  }, [repositoryUrl]);
+  }, [repoName, commitSha]);
 
   const handleSendMessage = async () => {
     if (!input.trim() || isLoading) return;
@@ -80,8 +85,7 @@ export default function ChatInterface({ repositoryUrl, files, onClose }: ChatInt
     let currentSessionId = sessionId;
     if (!currentSessionId) {
       try {
-        const repoName = repositoryUrl.replace(/^https?:\/\/(www\.)?github\.com\//, '');
-        const session = await ensureSession(repoName);
+        const session = await ensureSession(repoName, 'default_user', commitSha, repositorySummary);
         if (session) {
           currentSessionId = session.session_id;
           setSessionId(currentSessionId);
@@ -112,8 +116,6 @@ export default function ChatInterface({ repositoryUrl, files, onClose }: ChatInt
     setIsLoading(true);
 
     try {
-      const repoName = repositoryUrl.replace(/^https?:\/\/(www\.)?github\.com\//, '');
-      
       const response = await fetch('https://cloud-run-hackathon-backend-816885386955.asia-southeast1.run.app/chat', {
         method: 'POST',
         headers: {
@@ -124,6 +126,7 @@ export default function ChatInterface({ repositoryUrl, files, onClose }: ChatInt
           repository: repoName,
           files: files.map(f => ({ path: f.path, content: f.content })),
           session_id: currentSessionId,
+          commit_sha: commitSha,
           user_id: 'default_user'
         }),
       });
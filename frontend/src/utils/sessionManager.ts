@@ -9,6 +9,7 @@ interface SessionInfo {
   session_id: string;
   user_id: string;
   repository: string;
+  commit_sha?: string;
 }
 
 /**
@@ -16,9 +17,10 @@ interface SessionInfo {
  */
 export async function checkSessionExists(
   repository: string,
-  userId: string = 'default_user'
+  userId: string = 'default_user',
+  commitSha?: string
 ): Promise<boolean> {
-  const sessionId = generateSessionId(repository);
+  const sessionId = generateSessionId(repository, commitSha);
 
   try {
     // Try to get the session from the agent service via backend
@@ -45,9 +47,11 @@ export async function checkSessionExists(
  */
 export async function createSession(
   repository: string,
-  userId: string = 'default_user'
+  userId: string = 'default_user',
+  commitSha?: string,
+  repositorySummary?: string
 ): Promise<SessionInfo | null> {
-  const sessionId = generateSessionId(repository);
+  const sessionId = generateSessionId(repository, commitSha);
 
   try {
     const response = await fetch(`${BACKEND_URL}/create-session`, {
@@ -59,6 +63,8 @@ export async function createSession(
         repository,
         user_id: userId,
         session_id: sessionId,
+        commit_sha: commitSha,
+        repository_summary: repositorySummary,
       }),
     });
 
@@ -71,6 +77,7 @@ export async function createSession(
       session_id: data.session_id || sessionId,
       user_id: data.user_id || userId,
       repository: data.repository || repository,
+      commit_sha: commitSha,
     };
   } catch (error) {
     console.error('Error creating session:', error);
@@ -83,41 +90,46 @@ export async function createSession(
  */
 export async function ensureSession(
   repository: string,
-  userId: string = 'default_user'
+  userId: string = 'default_user',
+  commitSha?: string,
+  repositorySummary?: string
 ): Promise<SessionInfo | null> {
   // Check if session already exists
-  const exists = await checkSessionExists(repository, userId);
+  const exists = await checkSessionExists(repository, userId, commitSha);
 
   if (exists) {
     console.log('Session already exists for repository:', repository);
     return {
-      session_id: generateSessionId(repository),
+      session_id: generateSessionId(repository, commitSha),
       user_id: userId,
       repository,
+      commit_sha: commitSha,
     };
   }
 
   // Create new session
   console.log('Creating new session for repository:', repository);
-  return await createSession(repository, userId);
+  return await createSession(repository, userId, commitSha, repositorySummary);
 }
 
 /**
- * Generate a consistent session ID from repository name
+ * Generate a consistent session ID from repository name and commit SHA.
+ * Each ingested commit gets its own session so it is seeded with that commit's summary.
  */
-function generateSessionId(repository: string): string {
+function generateSessionId(repository: string, commitSha?: string): string {
   // Remove protocol and domain if full URL is provided
   const repoName = repository
     .replace(/^https?:\/\/(www\.)?github\.com\//, '')
     .replace(/\/$/, '');
 
   // Convert to session ID format
-  return `session_${repoName.replace(/\//g, '_')}`;
+  const sessionId = `session_${repoName.replace(/\//g, '_')}`;
+  return commitSha ? `${sessionId}_${commitSha.slice(0, 12)}` : sessionId;
 }
 
 /**
  * Get session ID for a repository without creating it
  */
-export function getSessionId(repository: string): string {
-  return generateSessionId(repository);
+export function getSessionId(repository: string, commitSha?: string): string {
+  return generateSessionId(repository, commitSha);
 }